@@ -1,5 +1,7 @@
 import base64
 import functools
+import io
+import os
 import typing as t
 
 from PIL import Image
@@ -64,18 +66,41 @@ class BytesNinja:
             raise
 
 
-class ImageNinjaMixin:
-    def __init__(self, path: str):
-        assert not path.lower().endswith(".jpg"), f"Compression not supported"
-        image = Image.open(path)
-        self.size = image.size
-        self.mode = image.mode
-        super().__init__(image.tobytes())
-        image.close()
+ImageSource = t.Union[str, os.PathLike, bytes, bytearray, memoryview, t.BinaryIO]
+ImageTarget = t.Union[str, os.PathLike, t.BinaryIO]
 
-    def save(self: t.Union["ImageNinjaMixin", BytesNinja], path: str):
+
+class ImageNinjaMixin:
+    COMPRESSED_FORMATS = ("JPEG", "MPO")
+    LOSSY_FORMATS = COMPRESSED_FORMATS + ("WEBP",)
+    DEFAULT_FORMAT = "PNG"
+
+    def __init__(self, source: ImageSource):
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = io.BytesIO(source)
+        with Image.open(source) as image:
+            assert (
+                image.format not in self.COMPRESSED_FORMATS
+            ), f"Compression not supported"
+            self.size = image.size
+            self.mode = image.mode
+            super().__init__(image.tobytes())
+
+    def save(
+        self: t.Union["ImageNinjaMixin", BytesNinja],
+        target: ImageTarget,
+        format: str = None,
+    ):
+        if format is None and isinstance(target, (str, os.PathLike)):
+            extension = os.path.splitext(target)[1].lower()
+            format = Image.registered_extensions().get(extension)
+        elif format is None:
+            format = self.DEFAULT_FORMAT
+        assert (
+            format is None or format.upper() not in self.LOSSY_FORMATS
+        ), f"Compression not supported"
         image = Image.frombytes(self.mode, self.size, self.data)
-        image.save(path)
+        image.save(target, format=format)
         image.close()
 
 
@@ -1,8 +1,8 @@
-import os
+import io
 
 import pytest
 
-from PIL import Image
+from PIL import Image, features
 
 from ..ninja import BytesNinja, ImageNinja, EncryptedBytesNinja, EncryptedImageNinja
 
@@ -47,23 +47,84 @@ class TestImageMixin:
     @classmethod
     def setup_class(cls):
         image = Image.new("RGB", (100, 100), color="black")
-        image.save("test.png")
+        buffer = io.BytesIO()
+        image.save(buffer, format="PNG")
         image.close()
-
-    @classmethod
-    def teardown_class(cls):
-        os.remove("test.png")
+        cls.image = buffer.getvalue()
 
 
 class TestImageNinja(TestImageMixin):
     @pytest.mark.parametrize("message", (b"f", b"{--21-37--}", b"foo"))
     def test_encryption(self, message):
-        crypto_image = ImageNinja("test.png")
+        crypto_image = ImageNinja(self.image)
         crypto_image.hide_message(message)
-        crypto_image.save("test_out.png")
+        out = io.BytesIO()
+        crypto_image.save(out)
+
+        assert message == ImageNinja(out.getvalue()).read_message()
+
+    @pytest.mark.parametrize(
+        "wrap", (bytes, bytearray, memoryview, io.BytesIO), ids=lambda w: w.__name__
+    )
+    def test_sources(self, wrap):
+        crypto_image = ImageNinja(wrap(self.image))
+        crypto_image.hide_message(b"foo")
+        out = io.BytesIO()
+        crypto_image.save(out)
+        out.seek(0)
 
-        assert message == ImageNinja("test_out.png").read_message()
-        os.remove("test_out.png")
+        assert b"foo" == ImageNinja(wrap(out.read())).read_message()
+
+    def test_path(self, tmp_path):
+        path = tmp_path / "test.png"
+        path.write_bytes(self.image)
+        crypto_image = ImageNinja(str(path))
+        crypto_image.hide_message(b"foo")
+        crypto_image.save(path)
+
+        assert b"foo" == ImageNinja(path).read_message()
+
+    def test_save_format(self):
+        crypto_image = ImageNinja(self.image)
+        out = io.BytesIO()
+        crypto_image.save(out, format="BMP")
+
+        assert "BMP" == Image.open(out).format
+
+    @pytest.mark.skipif(not features.check("webp"), reason="WEBP not supported")
+    def test_lossy_source(self):
+        image = Image.new("RGB", (100, 100), color="black")
+        buffer = io.BytesIO()
+        image.save(buffer, format="WEBP")
+        crypto_image = ImageNinja(buffer.getvalue())
+        crypto_image.hide_message(b"foo")
+        out = io.BytesIO()
+        crypto_image.save(out)
+
+        assert "PNG" == Image.open(out).format
+        assert b"foo" == ImageNinja(out.getvalue()).read_message()
+
+    def test_compression_not_supported(self, tmp_path):
+        path = tmp_path / "test.jpg"
+        Image.new("RGB", (10, 10), color="black").save(path)
+
+        with pytest.raises(AssertionError):
+            ImageNinja(str(path))
+
+    @pytest.mark.parametrize("target", ("test.jpg", "test.jpeg", "test.webp"))
+    def test_save_lossy_path(self, target, tmp_path):
+        crypto_image = ImageNinja(self.image)
+
+        with pytest.raises(AssertionError):
+            crypto_image.save(tmp_path / target)
+        assert not (tmp_path / target).exists()
+
+    @pytest.mark.parametrize("format", ImageNinja.LOSSY_FORMATS)
+    def test_save_lossy_format(self, format):
+        crypto_image = ImageNinja(self.image)
+
+        with pytest.raises(AssertionError):
+            crypto_image.save(io.BytesIO(), format=format)
 
 
 class TestEncryptedBytesNinja:
@@ -86,23 +147,21 @@ class TestEncryptedBytesNinja:
 
 class TestEncryptedImageNinja(TestImageMixin):
     def test_invalid_password(self):
-        ninja = EncryptedImageNinja("test.png", password="foo")
+        ninja = EncryptedImageNinja(self.image, password="foo")
         ninja.hide_message(b"secret")
-        ninja.save("test_out.png")
+        out = io.BytesIO()
+        ninja.save(out)
 
-        ninja = EncryptedImageNinja("test_out.png", password="baz")
+        ninja = EncryptedImageNinja(out.getvalue(), password="baz")
         with pytest.raises(EncryptedImageNinja.InvalidPassword):
             ninja.read_message()
 
-        os.remove("test_out.png")
-
     @pytest.mark.parametrize("message", (b"f", b"{--21-37--}", b"foo"))
     def test_encryption(self, message):
-        ninja = EncryptedImageNinja("test.png", password="foo")
+        ninja = EncryptedImageNinja(self.image, password="foo")
         ninja.hide_message(message)
-        ninja.save("test_out.png")
+        out = io.BytesIO()
+        ninja.save(out)
 
-        ninja = EncryptedImageNinja("test_out.png", password="foo")
+        ninja = EncryptedImageNinja(out.getvalue(), password="foo")
         assert message == ninja.read_message()
-
-        os.remove("test_out.png")
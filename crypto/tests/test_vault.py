@@ -1,4 +1,4 @@
-import os
+import io
 
 import pytest
 
@@ -16,9 +16,42 @@ class TestImageVault:
 
     def test_performance(self):
         image = Image.new('RGB', (4000, 4000), color='black')
-        image.save('test.png')
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG')
 
-        vault = ImageVault('test.png', password='', for_write=True)
-        vault.save('test.png')
+        vault = ImageVault(buffer.getbuffer(), password='', for_write=True)
+        vault.save(io.BytesIO())
+        buffer.write(b'\x00')
 
-        os.remove('test.png')
+    def test_in_memory(self):
+        image = Image.new('RGB', (100, 100), color='black')
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG')
+        buffer.seek(0)
+
+        vault = ImageVault(buffer, password='foo', for_write=True)
+        vault.passwords.append(Password('foo', 'bar', 'baz'))
+        out = io.BytesIO()
+        vault.save(out)
+
+        vault = ImageVault(out.getvalue(), password='foo')
+        assert [Password('foo', 'bar', 'baz')] == vault.passwords
+
+    def test_save_without_target(self):
+        image = Image.new('RGB', (100, 100), color='black')
+        buffer = io.BytesIO()
+        image.save(buffer, format='PNG')
+
+        vault = ImageVault(buffer.getvalue(), password='', for_write=True)
+        with pytest.raises(AssertionError):
+            vault.save()
+
+    def test_path(self, tmp_path):
+        path = str(tmp_path / 'test.png')
+        Image.new('RGB', (100, 100), color='black').save(path)
+
+        vault = ImageVault(path, password='foo', for_write=True)
+        vault.passwords.append(Password('foo', 'bar', 'baz'))
+        vault.save()
+
+        assert vault.passwords == ImageVault(path, password='foo').passwords
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 import json
+import os
 import typing as t
 
-from .ninja import EncryptedImageNinja
+from .ninja import EncryptedImageNinja, ImageSource, ImageTarget
 
 
 @dataclass()
@@ -18,9 +19,9 @@ class Password:
 class ImageVault:
     passwords: t.List[Password]
 
-    def __init__(self, path: str, password: str, for_write=False):
-        self.path = path
-        self.image_ninja = EncryptedImageNinja(self.path, password=password)
+    def __init__(self, source: ImageSource, password: str, for_write=False):
+        self.path = source if isinstance(source, (str, os.PathLike)) else None
+        self.image_ninja = EncryptedImageNinja(source, password=password)
         self.passwords = []
         if not for_write:
             self.passwords = self._from_bytes(self.image_ninja.read_message())
@@ -41,9 +42,12 @@ class ImageVault:
         ), f"Expected `{repr(data)}` to be of type List[List[3]]"
         return [Password(*p) for p in data]
 
-    def save(self, path: str = None):
+    def save(self, target: ImageTarget = None):
+        if target is None:
+            assert self.path is not None, f"Expected a target to save the vault to"
+            target = self.path
         self.image_ninja.hide_message(self._to_bytes(self.passwords))
-        self.image_ninja.save(path or self.path)
+        self.image_ninja.save(target)
 
 
 123